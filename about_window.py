@@ -2,16 +2,18 @@
 # about_window.py — GTK4/Libadwaita About window for Dog Ear
 
 from __future__ import annotations
+import types
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw
+# Gtk/Adw are imported inside show_about() so they load only when it's opened.
 
 # --- at the top of about_window.py, after the imports ---
 
 WEBSITE = "https://github.com/jessemcg/Dog-Ear"
 ISSUE_URL = "https://github.com/jessemcg/Dog-Ear/issues"
-DEVELOPERS = ["Jesse McGowan"]
+DEVELOPERS = ("Jesse McGowan",)
+_DEV_NAME = ", ".join(DEVELOPERS)
 COPYRIGHT = "© 2025 Jesse McGowan"
 
 # AppStream-compatible markup: <p>, <ul>/<li>, <ol>/<li>, inline <em>, <code> (no <a>)
@@ -25,13 +27,21 @@ RELEASE_NOTES = (
     "</ul>"
 )
 
-DEFAULTS = dict(
+DEFAULTS = types.MappingProxyType(dict(
     website=WEBSITE,
     issue_url=ISSUE_URL,
     developers=DEVELOPERS,
     release_notes=RELEASE_NOTES,
     copyright=COPYRIGHT,
-)
+))
+
+# Cached About window; the content is static so it is built once per parent.
+_about_win = None
+
+
+def _forget_about_win(*_args) -> None:
+    global _about_win
+    _about_win = None
 
 def show_about_default(parent, *, app_id: str, app_name: str, version: str):
     # Uses module defaults for everything else
@@ -51,7 +61,7 @@ def show_about(
     version: str,
     website: str,
     issue_url: str,
-    developers: list[str] | None = None,
+    developers: tuple[str, ...] | list[str] | None = None,
     release_notes: str | None = None,   # Expect AppStream markup string
     copyright: str | None = None,
 ):
@@ -62,7 +72,18 @@ def show_about(
         <p>, <ul>/<li>, <ol>/<li>, with inline <em> and <code>.
         (No <a> links in release notes.)
     """
+    global _about_win
+    if _about_win is not None and _about_win.get_transient_for() is parent:
+        _about_win.present()
+        return
+
+    from gi.repository import Adw, Gtk
+
     win = Adw.AboutWindow(transient_for=parent, modal=True)
+    # Hide rather than destroy on close so the next open can just present().
+    win.set_hide_on_close(True)
+    win.set_destroy_with_parent(True)
+    win.connect("destroy", _forget_about_win)
 
     # Identity
     win.set_application_name(app_name)
@@ -72,8 +93,8 @@ def show_about(
     # Developer / Credits
     devs = developers or []
     if devs:
-        win.set_developer_name(", ".join(devs))
-        win.set_developers(devs)
+        win.set_developer_name(_DEV_NAME if devs is DEVELOPERS else ", ".join(devs))
+        win.set_developers(list(devs))
     else:
         win.set_developer_name("")
 
@@ -98,5 +119,6 @@ def show_about(
         # AboutWindow exposes a "copyright" property
         win.set_property("copyright", copyright)
 
+    _about_win = win
     win.present()
 
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import atexit
+import ctypes
+import fcntl
+import io
 import os
 import shutil
+import struct
 import sys
 import tempfile
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import Iterable
 
 import gi
 
@@ -16,17 +23,22 @@ from gi.repository import GLib
 DEBUG = os.getenv("DOGEAR_DEBUG") == "1"
 
 
+_LOG_FH: io.TextIOWrapper | None = None
+
+
 def dlog(msg: str) -> None:
     """Emit a debug line when DOGEAR_DEBUG=1."""
+    global _LOG_FH
     if not DEBUG:
         return
     try:
         line = f"[dogear] {msg}\n"
-        sys_stderr = getattr(__import__("sys"), "stderr")
-        sys_stderr.write(line)
-        sys_stderr.flush()
-        with open("/tmp/dogear.log", "a", encoding="utf-8") as handle:
-            handle.write(line)
+        sys.stderr.write(line)
+        sys.stderr.flush()
+        if _LOG_FH is None:
+            _LOG_FH = open("/tmp/dogear.log", "a", encoding="utf-8", buffering=1)
+            atexit.register(_LOG_FH.close)
+        _LOG_FH.write(line)
     except Exception:
         # Debug logging must never be able to crash the app.
         pass
@@ -40,58 +52,220 @@ APP_VERSION = "0.1.0"
 
 COMPLETED_DIRNAME = f"{APP_SLUG}_Completed"
 TEXTPAGES_DIRNAME = f"{APP_SLUG}_TextPages"
+READY_MARKER = ".dogear_ready"
+SEEDED_MARKER = ".dogear_seeded"
 
 
 def _share_root(app_id: str) -> str:
     return f"/app/share/{app_id}"
 
 
+# These never change for the lifetime of the process, so resolve them once.
+_USER_CFG = GLib.get_user_config_dir()
+_USER_DATA = GLib.get_user_data_dir()
+_UID = os.getuid()
+_RUNTIME = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{_UID}"
+_XDG_BASES = {"config": _USER_CFG, "data": _USER_DATA}
+
+
 def _xdg(app_slug: str, kind: str, *parts: str) -> str:
-    if kind == "config":
-        base = GLib.get_user_config_dir()
-    elif kind == "data":
-        base = GLib.get_user_data_dir()
-    else:
-        base = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
-    root = os.path.join(base, app_slug)
-    return os.path.join(root, *parts)
+    base = _XDG_BASES.get(kind, _RUNTIME)
+    if not parts:
+        return f"{base}/{app_slug}"
+    return f"{base}/{app_slug}/{'/'.join(parts)}"
 
 
 def _runtime_root(app_slug: str) -> str:
-    base = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
-    candidate = os.path.join(base, app_slug)
+    candidate = f"{_RUNTIME}/{app_slug}"
     try:
         os.makedirs(candidate, exist_ok=True)
-        probe = os.path.join(candidate, ".probe")
-        Path(probe).write_text("", encoding="utf-8")
-        os.remove(probe)
-        return candidate
+        if os.access(candidate, os.W_OK | os.X_OK):
+            return candidate
     except Exception:
-        return tempfile.mkdtemp(prefix=f"{app_slug}-")
+        pass
+    return tempfile.mkdtemp(prefix=f"{app_slug}-")
 
 
 def dir_uri(path: str) -> str:
-    """Return a file:// URI for a directory, ensuring a trailing slash."""
-    abspath = os.path.abspath(path)
-    if os.path.isdir(abspath) and not abspath.endswith(os.sep):
+    """Return a file:// URI for a directory path, ensuring a trailing slash.
+
+    Callers only ever pass directories, so no isdir() check is made.
+    """
+    abspath = path if os.path.isabs(path) else os.path.join(os.getcwd(), path)
+    if not abspath.endswith(os.sep):
         abspath = abspath + os.sep
     return "file://" + abspath
 
 
+# Anything not ending in one of these (__pycache__, *.pyc, *.pyo, ...) is
+# skipped by the same endswith() test.
+_SCRIPT_EXTS = (".sh", ".py", ".SH", ".PY")
+
+# folder -> (st_mtime_ns, scripts); adding/removing a script bumps the dir mtime.
+_SCRIPTS_CACHE: dict[str, tuple[int, list[str]]] = {}
+
+
 def list_local_scripts(folder: str) -> list[str]:
     try:
-        names = os.listdir(folder)
-    except Exception:
+        mtime = os.stat(folder).st_mtime_ns
+    except OSError:
         return []
+    cached = _SCRIPTS_CACHE.get(folder)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
     scripts: list[str] = []
-    for name in names:
-        if name.startswith(".") or name in {"__pycache__"} or name.endswith((".pyc", ".pyo")):
-            continue
-        if name.lower().endswith((".sh", ".py")):
-            path = os.path.join(folder, name)
-            if os.path.isfile(path):
-                scripts.append(path)
-    return sorted(scripts, key=lambda path: os.path.basename(path).lower())
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if name[0] == "." or not name.endswith(_SCRIPT_EXTS):
+                    continue
+                if entry.is_file():
+                    scripts.append(entry.path)
+    except Exception:
+        return []
+    # Every path shares the same folder prefix, so this orders by basename.
+    scripts.sort(key=str.lower)
+    _SCRIPTS_CACHE[folder] = (mtime, scripts)
+    return list(scripts)
+
+
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def fast_copy(src: str, dst: str) -> None:
+    """Copy a file like shutil.copy2, but without pulling bytes through Python.
+
+    Tries a reflink (FICLONE) first, then in-kernel copy_file_range, then
+    sendfile, and only falls back to shutil.copyfile when none is supported.
+    """
+    copied = False
+    sfd = os.open(src, os.O_RDONLY)
+    try:
+        dfd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                fcntl.ioctl(dfd, _FICLONE, sfd)
+                copied = True
+            except OSError:
+                size = os.fstat(sfd).st_size
+                # Both calls advance the shared file offsets, so sendfile can
+                # pick up wherever copy_file_range gave up.
+                offset = 0
+                if hasattr(os, "copy_file_range"):
+                    try:
+                        while offset < size:
+                            n = os.copy_file_range(sfd, dfd, size - offset)
+                            if not n:
+                                break
+                            offset += n
+                    except OSError:
+                        pass
+                if offset < size:
+                    try:
+                        while offset < size:
+                            n = os.sendfile(dfd, sfd, None, size - offset)
+                            if not n:
+                                break
+                            offset += n
+                    except OSError:
+                        pass
+                copied = offset >= size
+        finally:
+            os.close(dfd)
+    finally:
+        os.close(sfd)
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _link_tree(src: str, dst: str) -> None:
+    """Populate dst from src, hardlinking files and copying when linking fails.
+
+    Linking fails with EXDEV across filesystems (e.g. Flatpak's /app), in
+    which case fast_copy reflinks or copies the file instead.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = f"{dst}/{entry.name}"
+            if entry.is_dir():
+                _link_tree(entry.path, target)
+                continue
+            try:
+                os.link(entry.path, target)
+            except OSError:
+                fast_copy(entry.path, target)
+
+
+# linux/inotify.h
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_IN_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len; then name[len]
+
+
+class DirWatch:
+    """inotify watch on one directory, reporting finished writes to given names.
+
+    Only IN_CLOSE_WRITE and IN_MOVED_TO are requested, so the IN_MODIFY bursts
+    of a partial write never wake the main loop. The directory rather than the
+    file is watched because atomic saves rename a new inode over the old one.
+    Raises OSError when inotify is unavailable.
+    """
+
+    def __init__(self, folder: str, names: Iterable[str], callback) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(folder), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed: {folder}")
+        self._fd = fd
+        self._names = frozenset(os.fsencode(n) for n in names)
+        self._callback = callback
+        self._source = 0
+        try:
+            self._source = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT, fd, GLib.IOCondition.IN, self._on_ready
+            )
+        except Exception:
+            # The caller falls back to Gio.FileMonitor; don't leak the fd.
+            os.close(fd)
+            raise
+
+    def _on_ready(self, fd: int, _condition) -> bool:
+        hit = False
+        while True:
+            try:
+                data = os.read(fd, 4096)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                _wd, mask, _cookie, length = _IN_EVENT.unpack_from(data, offset)
+                offset += _IN_EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                # On overflow (wd -1, no name) events were lost; assume a hit.
+                hit = hit or bool(mask & _IN_Q_OVERFLOW) or name in self._names
+        # However many events were queued, the callback runs once.
+        if hit:
+            self._callback()
+        return True
+
+    def close(self) -> None:
+        if self._source:
+            GLib.source_remove(self._source)
+            self._source = 0
+            os.close(self._fd)
 
 
 @dataclass
@@ -107,37 +281,58 @@ class AppContext:
     input_folder: str = field(init=False)
     user_regex_dir: str = field(init=False)
     user_post_dir: str = field(init=False)
-    completed_host: str = field(init=False)
-    host_view_text: str = field(init=False)
-    shm_completed_dir: str = field(init=False)
-    shm_root: str = field(init=False)
-    shm_text_dir: str = field(init=False)
-    shm_toc_dir: str = field(init=False)
-    toc_file_path: str = field(init=False)
-    combined_pdf_path: str = field(init=False)
-    completed_record_pdf: str = field(init=False)
+    # Directories known to exist, so hot paths can skip their mkdir calls.
+    _dirs_ready: set[str] = field(default_factory=set, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.share_root = _share_root(self.app_id)
-        self.system_regex_dir = os.path.join(self.share_root, "regexes")
-        self.system_post_dir = os.path.join(self.share_root, "post_processing")
-        self.system_input_seed_dir = os.path.join(self.share_root, "input_seed")
-
-        self.input_folder = _xdg(self.app_slug, "data", "input")
-        self.user_regex_dir = _xdg(self.app_slug, "config", "regexes")
-        self.user_post_dir = _xdg(self.app_slug, "config", "post_processing")
-
-        self.shm_root = _runtime_root(self.app_slug)
-        self.shm_text_dir = os.path.join(self.shm_root, "TextPages")
-        self.shm_toc_dir = os.path.join(self.shm_root, "TOC")
-        self.shm_completed_dir = os.path.join(self.shm_root, COMPLETED_DIRNAME)
-        self.toc_file_path = os.path.join(self.shm_toc_dir, "toc.txt")
-        self.combined_pdf_path = os.path.join(self.shm_root, "combined_tmp.pdf")
-        self.completed_record_pdf = os.path.join(self.shm_completed_dir, "bookmarked.pdf")
-
-        persist_root = _xdg(self.app_slug, "data", "output")
-        self.completed_host = os.path.join(persist_root, COMPLETED_DIRNAME)
-        self.host_view_text = os.path.join(persist_root, TEXTPAGES_DIRNAME)
+        # Paths are interned so comparisons and dict lookups on them stay cheap.
+        share = self.share_root = sys.intern(_share_root(self.app_id))
+        self.system_regex_dir = sys.intern(f"{share}/regexes")
+        self.system_post_dir = sys.intern(f"{share}/post_processing")
+        self.system_input_seed_dir = sys.intern(f"{share}/input_seed")
+
+        self.input_folder = sys.intern(_xdg(self.app_slug, "data", "input"))
+        self.user_regex_dir = sys.intern(_xdg(self.app_slug, "config", "regexes"))
+        self.user_post_dir = sys.intern(_xdg(self.app_slug, "config", "post_processing"))
+
+    # ── Lazily resolved paths ──────────────────────────────────────────────
+    # The runtime root touches disk, so it and everything below it are only
+    # computed on first use.
+    @cached_property
+    def shm_root(self) -> str:
+        return sys.intern(_runtime_root(self.app_slug))
+
+    @cached_property
+    def shm_text_dir(self) -> str:
+        return sys.intern(f"{self.shm_root}/TextPages")
+
+    @cached_property
+    def shm_toc_dir(self) -> str:
+        return sys.intern(f"{self.shm_root}/TOC")
+
+    @cached_property
+    def shm_completed_dir(self) -> str:
+        return sys.intern(f"{self.shm_root}/{COMPLETED_DIRNAME}")
+
+    @cached_property
+    def toc_file_path(self) -> str:
+        return sys.intern(f"{self.shm_toc_dir}/toc.txt")
+
+    @cached_property
+    def combined_pdf_path(self) -> str:
+        return sys.intern(f"{self.shm_root}/combined_tmp.pdf")
+
+    @cached_property
+    def completed_record_pdf(self) -> str:
+        return sys.intern(f"{self.shm_completed_dir}/bookmarked.pdf")
+
+    @cached_property
+    def completed_host(self) -> str:
+        return sys.intern(_xdg(self.app_slug, "data", "output", COMPLETED_DIRNAME))
+
+    @cached_property
+    def host_view_text(self) -> str:
+        return sys.intern(_xdg(self.app_slug, "data", "output", TEXTPAGES_DIRNAME))
 
     # ── Seeding & directory helpers ────────────────────────────────────────
     def seed_user_data(self) -> tuple[bool, bool, bool]:
@@ -145,37 +340,65 @@ class AppContext:
             seeded_regex = self._seed_once(self.system_regex_dir, self.user_regex_dir)
             seeded_posts = self._seed_once(self.system_post_dir, self.user_post_dir)
             seeded_input = self._seed_input_once()
-            dlog(f"Seeding: regex={seeded_regex} posts={seeded_posts} input={seeded_input}")
+            if DEBUG:
+                dlog(f"Seeding: regex={seeded_regex} posts={seeded_posts} input={seeded_input}")
             return seeded_regex, seeded_posts, seeded_input
         except Exception as exc:
             dlog(f"Seeding failed: {exc}")
             return False, False, False
 
     def ensure_runtime_dirs(self) -> None:
+        marker = f"{self.shm_root}/{READY_MARKER}"
+        runtime = {self.shm_root, self.shm_text_dir, self.shm_toc_dir, self.shm_completed_dir}
+        host = {
+            self.input_folder,
+            self.user_regex_dir,
+            self.user_post_dir,
+            self.completed_host,
+            self.host_view_text,
+        }
+        # Either side can be deleted behind our back (a tmpfs cleaner can leave
+        # the marker but not its siblings), so every leaf gets an isdir check.
+        have_marker = os.path.exists(marker)
+        folders = runtime | host
         try:
-            for folder in (
-                self.shm_root,
-                self.shm_text_dir,
-                self.shm_toc_dir,
-                self.input_folder,
-                self.user_regex_dir,
-                self.user_post_dir,
-                self.shm_completed_dir,
-                self.completed_host,
-                self.host_view_text,
-            ):
-                os.makedirs(folder, exist_ok=True)
-            dlog("Created runtime/config/data dirs")
+            # Ancestors of another entry (e.g. shm_root) come for free when
+            # makedirs creates the descendant, so only the leaves are visited.
+            leaves = [f for f in folders if not any(o.startswith(f + "/") for o in folders)]
+            for folder in leaves:
+                if not os.path.isdir(folder):
+                    os.makedirs(folder, exist_ok=True)
+            self._dirs_ready.update(folders)
+            if not have_marker:
+                open(marker, "w").close()
+                dlog("Created runtime/config/data dirs")
         except Exception as exc:
             dlog(f"Dir create failed: {exc}")
 
+    def ensure_dir(self, folder: str, fresh: bool = False) -> None:
+        """makedirs(folder), skipped once the folder is known to exist.
+
+        The cache can go stale if the folder is deleted later; callers that hit
+        ENOENT pass fresh=True to drop the entry and create the folder again.
+        """
+        if fresh:
+            self._dirs_ready.discard(folder)
+        if folder not in self._dirs_ready:
+            os.makedirs(folder, exist_ok=True)
+            self._dirs_ready.add(folder)
+
     def reset_toc_file(self) -> None:
-        Path(self.shm_toc_dir).mkdir(parents=True, exist_ok=True)
-        Path(self.toc_file_path).write_text("", encoding="utf-8")
+        self.ensure_dir(self.shm_toc_dir)
+        try:
+            open(self.toc_file_path, "w", encoding="utf-8").close()
+        except FileNotFoundError:
+            self.ensure_dir(self.shm_toc_dir, fresh=True)
+            open(self.toc_file_path, "w", encoding="utf-8").close()
 
     def read_toc_text(self) -> str:
         try:
-            return Path(self.toc_file_path).read_text(encoding="utf-8")
+            with open(self.toc_file_path, "rb") as handle:
+                return handle.read().decode("utf-8", "replace")
         except FileNotFoundError:
             return ""
         except Exception as exc:
@@ -186,25 +409,32 @@ class AppContext:
 
     # ── Internal helpers ───────────────────────────────────────────────────
     def _seed_once(self, src: str, dst: str) -> bool:
+        marker = f"{dst}/{SEEDED_MARKER}"
+        if os.path.exists(marker):
+            return False
+        seeded = False
         try:
             if src and os.path.isdir(src) and not os.path.isdir(dst):
-                os.makedirs(os.path.dirname(dst), exist_ok=True)
-                shutil.copytree(src, dst)
-                return True
+                _link_tree(src, dst)
+                seeded = True
+            if os.path.isdir(dst):
+                Path(marker).touch()
         except Exception:
             pass
-        return False
+        return seeded
 
     def _seed_input_once(self) -> bool:
+        marker = f"{self.input_folder}/{SEEDED_MARKER}"
+        if os.path.exists(marker):
+            return False
         try:
             os.makedirs(self.input_folder, exist_ok=True)
-            if any(os.scandir(self.input_folder)):
-                return False
+            with os.scandir(self.input_folder) as existing:
+                if any(existing):
+                    return False
             if os.path.isdir(self.system_input_seed_dir):
-                for name in os.listdir(self.system_input_seed_dir):
-                    src = os.path.join(self.system_input_seed_dir, name)
-                    if os.path.isfile(src):
-                        shutil.copy2(src, os.path.join(self.input_folder, name))
+                _link_tree(self.system_input_seed_dir, self.input_folder)
+                Path(marker).touch()
                 return True
         except Exception:
             pass
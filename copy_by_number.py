@@ -2,16 +2,24 @@
 from __future__ import annotations
 import os
 import tempfile
-from pathlib import Path
 
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, Gdk, GLib  # noqa: F401
+# gi.repository modules are imported where used so loading this module stays cheap.
+
+# Resolved once at import; honours PAGE_FILE_FMT / PAGE_PAD if predefined.
+_PAGE_PAD = globals().get("PAGE_PAD", 4)
+_PAGE_FMT = globals().get("PAGE_FILE_FMT")
+if not (isinstance(_PAGE_FMT, str) and "{" in _PAGE_FMT):
+    _PAGE_FMT = f"{{:0{_PAGE_PAD}d}}.txt"
+
 
 class CopyByNumber:
     """Stateless helpers; methods expect a window 'self' that has _set_status()."""
 
+    _PAGE_FMT = _PAGE_FMT
+
     # ---------- path helpers (RESTORED) ----------
     @staticmethod
     def _resolve_text_pages_dir(self) -> str | None:
@@ -22,7 +30,17 @@ class CopyByNumber:
           2) global 'shm_text_dir' (if defined elsewhere)
           3) env PDFMARKER_TEXT_PAGES_DIR
           4) runtime temp dir / DogEar_TextPages (fallback)
+        The result is cached on 'self' after the first lookup.
         """
+        cached = getattr(self, "_cached_text_dir", None)
+        if cached:
+            return cached
+        result = CopyByNumber._lookup_text_pages_dir(self)
+        self._cached_text_dir = result
+        return result
+
+    @staticmethod
+    def _lookup_text_pages_dir(self) -> str | None:
         if hasattr(self, "text_record_folder"):
             return getattr(self, "text_record_folder")
         trf = globals().get("shm_text_dir")
@@ -34,7 +52,7 @@ class CopyByNumber:
         runtime_root = os.environ.get("XDG_RUNTIME_DIR")
         if runtime_root:
             return os.path.join(runtime_root, "DogEar", "DogEar_TextPages")
-        return str(Path(tempfile.gettempdir()) / "DogEar_TextPages")
+        return os.path.join(tempfile.gettempdir(), "DogEar_TextPages")
 
     @staticmethod
     def _format_page_filename(self, n: int) -> str:
@@ -42,11 +60,7 @@ class CopyByNumber:
         Format the file name for page 'n'.
         Respects PAGE_FILE_FMT (e.g., '{:04d}.txt') if defined; otherwise uses PAGE_PAD.
         """
-        fmt = globals().get("PAGE_FILE_FMT")
-        if isinstance(fmt, str) and "{" in fmt:
-            return fmt.format(n)
-        pad = globals().get("PAGE_PAD", 4)
-        return f"{n:0{pad}d}.txt"
+        return CopyByNumber._PAGE_FMT.format(n)
 
     @staticmethod
     def _text_path_for(self, n: int) -> str:
@@ -55,11 +69,9 @@ class CopyByNumber:
 
     # ---------- clipboard helper (Wayland-friendly) ----------
     @staticmethod
-    def _copy_text_async(self, text: str, filename_for_status: str | None = None, verify: bool = True):
-        """
-        Copy to clipboard and (optionally) verify by reading back.
-        If verify is False (or unavailable), show a simple 'Copied.' status.
-        """
+    def _get_clipboard(self):
+        from gi.repository import Gdk
+
         # Prefer widget-owned clipboard (GTK4) then fall back to display clipboard
         cb = None
         try:
@@ -73,53 +85,49 @@ class CopyByNumber:
                     cb = disp.get_clipboard()
             except Exception:
                 cb = None
+        return cb
 
-        if cb is None:
-            self._set_status("Copy failed: clipboard not available.")
-            return
+    @staticmethod
+    def _set_clipboard_text(self, cb, text: str) -> bool:
+        from gi.repository import Gdk
 
-        def _do_copy():
+        try:
+            provider = Gdk.ContentProvider.new_for_value(text)
+            cb.set_content(provider)
+        except Exception:
             try:
-                provider = Gdk.ContentProvider.new_for_value(text)
-                cb.set_content(provider)
-            except Exception:
-                try:
-                    cb.set_text(text)
-                except Exception as e:
-                    self._set_status(f"Copy failed: {e}")
-                    return False
-
-            if not verify:
-                self._set_status("Copied.")
+                cb.set_text(text)
+            except Exception as e:
+                self._set_status(f"Copy failed: {e}")
                 return False
+        return True
 
-            def _on_readback(_cb, res, _data):
-                try:
-                    got = _cb.read_text_finish(res)
-                except Exception:
-                    self._set_status("Copied.")
-                    return
-                if (got or "") == text:
-                    self._set_status(
-                        f"Copied {filename_for_status} to clipboard." if filename_for_status else "Copied."
-                    )
-                else:
-                    self._set_status("Copied (content mismatch on verify).")
+    @staticmethod
+    def _copy_simple_idle(self, cb, text: str) -> bool:
+        if CopyByNumber._set_clipboard_text(self, cb, text):
+            self._set_status("Copied.")
+        return False
 
-            try:
-                cb.read_text_async(priority=GLib.PRIORITY_DEFAULT,
-                                   cancellable=None,
-                                   callback=_on_readback,
-                                   user_data=None)
-            except Exception:
-                self._set_status("Copied.")
-            return False
+    @staticmethod
+    def _copy_text_simple(self, text: str):
+        """Copy to clipboard without read-back verification; shows 'Copied.'."""
+        from gi.repository import GLib
 
-        GLib.idle_add(_do_copy)
+        cb = CopyByNumber._get_clipboard(self)
+        if cb is None:
+            self._set_status("Copy failed: clipboard not available.")
+            return
+        # GTK handlers already run on the main thread; only hop there if we're not on it.
+        if GLib.main_context_default().is_owner():
+            CopyByNumber._copy_simple_idle(self, cb, text)
+        else:
+            GLib.idle_add(CopyByNumber._copy_simple_idle, self, cb, text)
 
     # ---------- UI entry point ----------
     @staticmethod
     def on_copy_text_number(self, *_):
+        from gi.repository import Adw, Gtk
+
         dlg = Adw.MessageDialog.new(self, "Copy Page Text", None)
         dlg.add_response("cancel", "Cancel")
         dlg.add_response("copy", "Copy")
@@ -154,28 +162,33 @@ class CopyByNumber:
                 return
 
             base = CopyByNumber._resolve_text_pages_dir(self)
-            if not base or not os.path.isdir(base):
+            if not base:
                 self._set_status(f"Text-pages dir not found: {base!r}")
                 d.destroy()
                 return
 
             path = CopyByNumber._text_path_for(self, n)
-            if not os.path.exists(path):
-                pad = globals().get("PAGE_PAD", 4)
-                self._set_status(f"No text file for {n:0{pad}d}.")
+            try:
+                with open(path, "rb") as f:
+                    content = f.read().decode("utf-8", "replace")
+            except FileNotFoundError:
+                if not os.path.isdir(base):
+                    self._set_status(f"Text-pages dir not found: {base!r}")
+                else:
+                    self._set_status(f"No text file for {n:0{_PAGE_PAD}d}.")
+                d.destroy()
+                return
+            except NotADirectoryError:
+                self._set_status(f"Text-pages dir not found: {base!r}")
                 d.destroy()
                 return
-
-            try:
-                content = Path(path).read_text(encoding="utf-8", errors="replace")
             except Exception as e:
                 self._set_status(f"Could not read file: {e}")
                 d.destroy()
                 return
 
             d.destroy()
-            # If you prefer no verify message: verify=False
-            CopyByNumber._copy_text_async(self, content, os.path.basename(path), verify=False)
+            CopyByNumber._copy_text_simple(self, content)
 
         dlg.connect("response", on_resp)
         dlg.present()
@@ -68,11 +68,19 @@ def main() -> None:
             import signal
 
             faulthandler.enable()
-            faulthandler.register(signal.SIGUSR2)
+            sigusr2 = getattr(signal, "SIGUSR2", None)
+            if sigusr2 is not None:
+                faulthandler.register(sigusr2)
         except Exception:
             pass
         dlog("Starting DogEarApp()")
 
+    # Bundled CSS; the window falls back to style.css on disk without it.
+    try:
+        Gio.resources_register(Gio.Resource.load(os.path.join(APP_DIR, "dogear.gresource")))
+    except Exception as exc:
+        dlog(f"GResource load failed: {exc}")
+
     try:
         DogEarApp().run(None)
     except Exception as exc:
@@ -16,7 +16,6 @@ PyMuPDF (pymupdf) must be installed.
 """
 from __future__ import annotations
 
-import re
 from typing import List, Optional, Callable, Tuple
 
 import fitz  # PyMuPDF
@@ -33,18 +32,17 @@ def _parse_toc_lines(toc_text: str, offset: int = 0) -> List[Tuple[int, str, int
     for raw in toc_text.splitlines():
         if not raw.strip():
             continue
-        # count leading tabs
-        i = 0
-        while i < len(raw) and raw[i] == '\t':
-            i += 1
-        level = i + 1  # PyMuPDF expects 1-based levels
-        line = raw[i:].rstrip()
-        m = re.match(r"^(.*)\s+(\d+)$", line)
-        if not m:
+        body = raw.lstrip('\t')
+        level = len(raw) - len(body) + 1  # PyMuPDF expects 1-based levels
+        line = body.rstrip()
+        parts = line.rsplit(None, 1)
+        if len(parts) == 1 and line[:1].isspace():
+            parts = ["", parts[0]]  # whitespace then a bare page number: empty title
+        if len(parts) != 2 or not parts[1].isdecimal():
             # Skip malformed lines rather than raising; keeps app resilient
             continue
-        title = m.group(1).strip()
-        page = int(m.group(2)) + offset
+        title = parts[0].strip()
+        page = int(parts[1]) + offset
         if page < 1:
             page = 1
         out.append((level, title, page))
@@ -20,19 +20,11 @@ def main() -> None:
     had_trailing_nl = original.endswith("\n")
     lines = original.splitlines()
 
-    seen: set[str] = set()
-    out: list[str] = []
-    removed = 0
-
-    for ln in lines:
-        if not ln.strip():   # keep all empty lines
-            out.append(ln)
-            continue
-        if ln not in seen:
-            seen.add(ln)
-            out.append(ln)
-        else:
-            removed += 1
+    # dict.fromkeys keeps the first of each key in order; empty lines are keyed
+    # by their index so every one of them survives.
+    firsts = dict.fromkeys(ln if ln.strip() else i for i, ln in enumerate(lines))
+    out = [lines[k] if isinstance(k, int) else k for k in firsts]
+    removed = len(lines) - len(out)
 
     toc_path.write_text("\n".join(out) + ("\n" if had_trailing_nl else ""), encoding="utf-8")
     print(f"Removed {removed} exact duplicate non-empty line(s). Updated: {toc_path}")
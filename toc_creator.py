@@ -18,18 +18,37 @@ import os
 import re
 import shutil
 import subprocess
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
 import fitz  # PyMuPDF
 
+try:
+    import re2  # optional: google-re2 gives linear-time matching
+except ImportError:
+    re2 = None
+
+try:  # Python 3.11+
+    from re import _constants as _sre_c, _parser as _sre_parse
+except ImportError:
+    import sre_constants as _sre_c, sre_parse as _sre_parse
+
 PAGE_FILE_FMT = "{:04d}.txt"
 PAGE_PAD = 4
 
 # ---------- canonicalization ----------
 def _canonicalize(text: str) -> str:
-    # Normalize line-endings and NBSPs to match your non-Flatpak pipeline
-    return text.replace("\r\n", "\n").replace("\r", "\n").replace("\u00A0", " ")
+    # Normalize line-endings and NBSPs to match your non-Flatpak pipeline.
+    # Most pages have neither, and a substring check is far cheaper than a copy.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\u00A0" in text:
+        text = text.replace("\u00A0", " ")
+    return text
 
 # ---------- regex loading ----------
 _FLAG_MAP = {
@@ -56,8 +75,23 @@ def _category_files(regexes_folder: str) -> List[Path]:
         if p.is_file() and not p.name.startswith(".") and p.name != "_order.txt"
     ]
 
-def _load_category_file(path: Path) -> List[Tuple[str, int]]:
-    items: List[Tuple[str, int]] = []
+_RE2_INLINE = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+# Backrefs, lookarounds and conditionals: RE2 rejects these (and logs about it).
+_RE2_UNSUPPORTED = re.compile(r"\\[1-9]|\(\?(?:[=!]|<[=!]|P=|\()")
+
+def _compile(line: str, flags: int) -> Pattern[str]:
+    """Prefer RE2 when installed; patterns it cannot express stay on `re`."""
+    if re2 is not None and not flags & re.VERBOSE and not _RE2_UNSUPPORTED.search(line):
+        inline = "".join(c for f, c in _RE2_INLINE if flags & f)
+        try:
+            return re2.compile(f"(?{inline}:{line})" if inline else line)
+        except Exception:
+            pass
+    return re.compile(line, flags)
+
+def _load_category_file(path: Path) -> List[Tuple[Pattern[str], int]]:
+    """Compile each pattern once; malformed lines are skipped."""
+    items: List[Tuple[Pattern[str], int]] = []
     flags = re.MULTILINE
     for raw in path.read_text(encoding="utf-8", errors="ignore").splitlines():
         line = raw.rstrip("\n")
@@ -69,9 +103,283 @@ def _load_category_file(path: Path) -> List[Tuple[str, int]]:
             continue
         if line.lstrip().startswith("#"):
             continue
-        items.append((line, flags))
+        try:
+            items.append((_compile(line, flags), flags))
+        except re.error:
+            continue
     return items
 
+# Group numbers shift inside an alternation, so patterns that refer back to
+# their own groups cannot share a prefilter.
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# A pattern can run once over the whole document only if it cannot tell the
+# page separator from a page edge: no lookarounds, no \A/\Z, and MULTILINE on
+# so '^'/'$' treat the '\n' separator like the start/end of a page.
+_PAGE_SEP = "\n"
+_JOIN_UNSAFE_RE = re.compile(r"\\[AZz]|\(\?(?:[=!]|<[=!])|\(\?[aiLmsux]*-")
+
+def _joinable(pat: Pattern[str], flags: int) -> bool:
+    return bool(flags & re.MULTILINE) and not _JOIN_UNSAFE_RE.search(pat.pattern)
+
+def _build_prefilters(
+    items: List[Tuple[Pattern[str], int]],
+) -> Tuple[List[Optional[Pattern[str]]], List[int]]:
+    """
+    Join patterns that share a flag set into one '(?:p1)|(?:p2)|...' search.
+    If the union finds nothing on a page, none of its members can match there
+    and the per-pattern finditer passes are skipped. Members still run on their
+    own when it hits, so captures and overlapping matches are unchanged.
+    Returns (prefilters, group index per item); a None prefilter means "always run".
+    """
+    by_flags: Dict[int, List[int]] = {}
+    for k, (pat, flags) in enumerate(items):
+        if not _BACKREF_RE.search(pat.pattern):
+            by_flags.setdefault(flags, []).append(k)
+
+    prefilters: List[Optional[Pattern[str]]] = [None]
+    gids = [0] * len(items)
+    for flags, members in by_flags.items():
+        if len(members) < 2:
+            continue
+        # A trailing '#' comment in verbose mode would swallow the ')'.
+        close = "\n)" if flags & re.VERBOSE else ")"
+        try:
+            union = re.compile(
+                "|".join(f"(?:{items[k][0].pattern}{close}" for k in members), flags
+            )
+        except re.error:
+            continue
+        prefilters.append(union)
+        for k in members:
+            gids[k] = len(prefilters) - 1
+    return prefilters, gids
+
+# Shorter hints (a space, "Q ") are on nearly every page and filter nothing.
+_MIN_HINT_LEN = 3
+
+def _literal_hint(pat: Pattern[str], flags: int) -> Optional[str]:
+    """
+    Longest run of literal characters every match must contain, or None.
+    Only plain literals at the top level (or inside an unquantified group)
+    count; anything optional, repeated, alternated or case-insensitive ends a run.
+    """
+    try:
+        parsed = _sre_parse.parse(pat.pattern, flags)
+    except Exception:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    runs: List[str] = []
+    cur: List[str] = []
+
+    def flush() -> None:
+        if cur:
+            runs.append("".join(cur))
+            cur.clear()
+
+    def walk(seq) -> None:
+        for op, av in seq:
+            if op is _sre_c.LITERAL:
+                cur.append(chr(av))
+            elif op is _sre_c.SUBPATTERN and not av[1] & re.IGNORECASE:
+                walk(av[3])
+            else:
+                flush()
+
+    walk(parsed)
+    flush()
+    best = max(runs, key=len, default="")
+    return best if len(best) >= _MIN_HINT_LEN else None
+
+# ---------- process pools ----------
+_MAX_POOL_WORKERS = 8
+
+def _pool_workers(total: int, min_pages: int) -> int:
+    """Worker count for a page-parallel job, or 0 when the serial path is cheaper."""
+    workers = min(os.cpu_count() or 1, _MAX_POOL_WORKERS)
+    return workers if workers >= 2 and total >= min_pages else 0
+
+def _process_pool(workers: int, **kwargs):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Never fork the GTK process itself.
+    ctx = multiprocessing.get_context("forkserver")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx, **kwargs)
+
+# ---------- scanning ----------
+Categories = Dict[str, List[Tuple[Pattern[str], int]]]
+# Per category: (prefilter unions, union index per pattern, joinable pattern indices,
+# required literal per pattern)
+ScanPlans = Dict[
+    str, Tuple[List[Optional[Pattern[str]]], List[int], Tuple[int, ...], List[Optional[str]]]
+]
+# Per category, per joined pattern index: {0-based page: titles in match order}
+JoinedHits = Dict[str, Dict[int, Dict[int, List[str]]]]
+
+# Below this many pages, worker start-up costs more than the scan itself.
+_PARALLEL_SCAN_MIN_PAGES = 256
+
+def _load_categories(cat_files: List[Path]) -> Tuple[Categories, ScanPlans]:
+    categories: Categories = {p.stem: _load_category_file(p) for p in cat_files}
+    plans: ScanPlans = {}
+    for cat, items in categories.items():
+        unions, gids = _build_prefilters(items)
+        # Patterns under a prefilter already skip most pages; the rest are
+        # cheaper as one pass over the joined document than one call per page.
+        joined = tuple(
+            k for k, (pat, flags) in enumerate(items) if gids[k] == 0 and _joinable(pat, flags)
+        )
+        hints = [_literal_hint(pat, flags) for pat, flags in items]
+        plans[cat] = (unions, gids, joined, hints)
+    return categories, plans
+
+@lru_cache(maxsize=16)
+def _load_all_categories(regexes_folder: str, fingerprint: Tuple[Tuple[str, int, int], ...]) -> Tuple[Categories, ScanPlans]:
+    """Cached _load_categories; any file added, removed or edited changes the fingerprint."""
+    return _load_categories([Path(regexes_folder, name) for name, _mtime, _size in fingerprint])
+
+def _fingerprint(cat_files: List[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    out = []
+    for p in cat_files:
+        st = p.stat()
+        out.append((p.name, st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+def _title(m) -> str:
+    # Use first capture if present, else the whole match
+    return (m.group(1) if m.lastindex else m.group(0)).strip()
+
+def _scan_joined(texts: List[str], categories: Categories, plans: ScanPlans) -> JoinedHits:
+    """
+    Run each joinable pattern once over all pages joined by _PAGE_SEP and map
+    match offsets back to pages. A pattern with any match that leaves its page
+    is dropped from the result and scanned page by page instead.
+    """
+    out: JoinedHits = {}
+    if not texts:
+        return out
+    joined = _PAGE_SEP.join(texts)
+    ends = list(accumulate(len(t) + len(_PAGE_SEP) for t in texts))
+    for cat, pat_items in categories.items():
+        cat_hits: Dict[int, Dict[int, List[str]]] = {}
+        for k in plans[cat][2]:
+            by_page: Dict[int, List[str]] = {}
+            page, limit = 0, ends[0]
+            for m in pat_items[k][0].finditer(joined):
+                start, end = m.span()
+                if start >= limit:
+                    page = bisect_right(ends, start, page)
+                    limit = ends[page]
+                if end >= limit:
+                    break
+                s = _title(m)
+                if s:
+                    by_page.setdefault(page, []).append(s)
+            else:
+                cat_hits[k] = by_page
+        out[cat] = cat_hits
+    return out
+
+_NO_JOINED: Dict[int, Dict[int, List[str]]] = {}
+_ALL_LIVE = (True,)
+
+def _scan_page(
+    text: str,
+    categories: Categories,
+    plans: ScanPlans,
+    joined: Optional[JoinedHits] = None,
+    page: int = 0,
+) -> Dict[str, List[str]]:
+    """Return the de-duplicated titles each category finds on one page, in pattern order."""
+    hits: Dict[str, List[str]] = {}
+    if not text or text.isspace():
+        # Any match here would strip to an empty title.
+        return hits
+    for cat, pat_items in categories.items():
+        unions, gids, _, hints = plans[cat]
+        cat_joined = joined[cat] if joined else _NO_JOINED
+        found: List[str] = []
+        extend = found.extend
+        if len(cat_joined) == len(pat_items):
+            # Every pattern ran over the joined document; just collect this page.
+            for by_page in cat_joined.values():
+                if page in by_page:
+                    extend(by_page[page])
+        else:
+            live = _ALL_LIVE if len(unions) == 1 else [u is None or u.search(text) is not None for u in unions]
+            for k, (pat, _flags) in enumerate(pat_items):
+                if k in cat_joined:
+                    extend(cat_joined[k].get(page, ()))
+                elif live[gids[k]] and (hints[k] is None or hints[k] in text):
+                    extend(filter(None, map(_title, pat.finditer(text))))
+        if found:
+            # dict.fromkeys de-duplicates while keeping first-seen order
+            hits[cat] = list(dict.fromkeys(found))
+    return hits
+
+def _scan_pages(
+    texts: List[str],
+    categories: Categories,
+    plans: ScanPlans,
+    update_progress=None,
+) -> List[Dict[str, List[str]]]:
+    joined = _scan_joined(texts, categories, plans)
+    page_hits: List[Dict[str, List[str]]] = []
+    for i, text in enumerate(texts):
+        page_hits.append(_scan_page(text, categories, plans, joined, i))
+        if update_progress:
+            update_progress((i + 1) / max(1, len(texts)))
+    return page_hits
+
+_worker_state: Optional[Tuple[Categories, ScanPlans]] = None
+
+def _init_scan_worker(cat_files: List[str]) -> None:
+    # Compile once per worker rather than pickling patterns with every chunk.
+    global _worker_state
+    _worker_state = _load_categories([Path(p) for p in cat_files])
+
+def _scan_chunk(texts: List[str]) -> List[Dict[str, List[str]]]:
+    categories, plans = _worker_state
+    return _scan_pages(texts, categories, plans)
+
+def _scan_pages_parallel(
+    page_texts: List[str],
+    cat_files: List[Path],
+    update_progress=None,
+) -> Optional[List[Dict[str, List[str]]]]:
+    """Scan page chunks in a process pool; None means "use the serial loop"."""
+    total = len(page_texts)
+    workers = _pool_workers(total, _PARALLEL_SCAN_MIN_PAGES)
+    if not workers:
+        return None
+    step = max(16, -(-total // (workers * 4)))
+    try:
+        from concurrent.futures import as_completed
+
+        page_hits: List[Dict[str, List[str]]] = [{}] * total
+        with _process_pool(
+            workers,
+            initializer=_init_scan_worker,
+            initargs=([str(p) for p in cat_files],),
+        ) as pool:
+            futures = {
+                pool.submit(_scan_chunk, page_texts[start:start + step]): start
+                for start in range(0, total, step)
+            }
+            done = 0
+            for fut in as_completed(futures):
+                chunk = fut.result()
+                start = futures[fut]
+                page_hits[start:start + len(chunk)] = chunk
+                done += len(chunk)
+                if update_progress:
+                    update_progress(done / total)
+        return page_hits
+    except Exception:
+        return None
+
 # ---------- utils ----------
 def _ensure_dir(p: str | Path) -> None:
     Path(p).mkdir(parents=True, exist_ok=True)
@@ -84,8 +392,8 @@ def _iter_pdfs(folder: str) -> List[str]:
     ]
 
 # ---------- extraction backends ----------
-def _extract_pages_pdftotext_py(pdf_path: str, out_dir: Path) -> Optional[int]:
-    """Return page count on success; None on failure."""
+def _extract_pages_pdftotext_py(pdf_path: str, out_dir: Path) -> Optional[List[str]]:
+    """Return the canonicalized page texts on success; None on failure."""
     try:
         import pdftotext  # C++ binding against Poppler
     except Exception:
@@ -94,14 +402,16 @@ def _extract_pages_pdftotext_py(pdf_path: str, out_dir: Path) -> Optional[int]:
         _ensure_dir(out_dir)
         with open(pdf_path, "rb") as f:
             pdf = pdftotext.PDF(f, physical=True)  # <-- key difference
+            texts: List[str] = []
             for i, page in enumerate(pdf, start=1):
                 txt = _canonicalize(page)
                 (out_dir / PAGE_FILE_FMT.format(i)).write_text(txt, encoding="utf-8")
-        return len(pdf)
+                texts.append(txt)
+        return texts
     except Exception:
         return None
 
-def _extract_pages_pdftotext_cli(pdf_path: str, out_dir: Path, page_count_hint: Optional[int]) -> Optional[int]:
+def _extract_pages_pdftotext_cli(pdf_path: str, out_dir: Path, page_count_hint: Optional[int]) -> Optional[List[str]]:
     exe = shutil.which("pdftotext")
     if not exe:
         return None
@@ -119,40 +429,77 @@ def _extract_pages_pdftotext_cli(pdf_path: str, out_dir: Path, page_count_hint:
         if pages is None or pages <= 0:
             return None
 
+        base_cmd = [exe, "-layout", "-eol", "unix", "-enc", "UTF-8"]
+
+        # One pass over the whole PDF; pdftotext ends every page with a form feed.
+        proc = subprocess.run(
+            [*base_cmd, pdf_path, "-"],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        chunks = proc.stdout.decode("utf-8", errors="ignore").split("\f")
+        if len(chunks) == pages + 1 and not chunks[-1].strip():
+            texts = [_canonicalize(chunk + "\f") for chunk in chunks[:-1]]
+            for i, txt in enumerate(texts, start=1):
+                (out_dir / PAGE_FILE_FMT.format(i)).write_text(txt, encoding="utf-8")
+            return texts
+
+        # Page count disagrees (stray form feeds in the text): go page by page.
+        texts: List[str] = []
         for i in range(1, pages + 1):
             out = out_dir / PAGE_FILE_FMT.format(i)
-            cmd = [
-                exe, "-layout",
-                "-eol", "unix",
-                "-enc", "UTF-8",
-                "-f", str(i), "-l", str(i),
-                pdf_path, str(out)
-            ]
+            cmd = [*base_cmd, "-f", str(i), "-l", str(i), pdf_path, str(out)]
             subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             # Post-process to match canonicalization used by non-Flatpak
             try:
-                txt = out.read_text(encoding="utf-8", errors="ignore")
-                out.write_text(_canonicalize(txt), encoding="utf-8")
+                txt = _canonicalize(out.read_text(encoding="utf-8", errors="ignore"))
+                out.write_text(txt, encoding="utf-8")
             except Exception:
-                pass
-        return pages
+                txt = ""
+            texts.append(txt)
+        return texts
     except Exception:
         return None
 
-def _extract_pages_fitz(pdf_path: str, out_dir: Path) -> int:
-    _ensure_dir(out_dir)
+_FITZ_FLAGS = getattr(fitz, "TEXT_PRESERVE_LIGATURES", 0) | getattr(fitz, "TEXT_PRESERVE_WHITESPACE", 0)
+
+# MuPDF documents are not thread-safe, so parallel extraction uses processes,
+# each opening its own copy of the PDF for a contiguous page range.
+_PARALLEL_EXTRACT_MIN_PAGES = 128
+
+def _fitz_page_text(pg) -> str:
+    return _canonicalize(pg.get_text("text", flags=_FITZ_FLAGS) if _FITZ_FLAGS else pg.get_text("text"))
+
+def _fitz_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
     with fitz.open(pdf_path) as doc:
-        try:
-            flags = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE  # type: ignore[attr-defined]
-        except Exception:
-            flags = 0
-        for i in range(doc.page_count):
-            pg = doc.load_page(i)
-            text = pg.get_text("text", flags=flags) if flags else pg.get_text("text")
-            (out_dir / PAGE_FILE_FMT.format(i + 1)).write_text(
-                _canonicalize(text), encoding="utf-8"
+        return [_fitz_page_text(doc.load_page(i)) for i in range(start, stop)]
+
+def _extract_fitz_parallel(pdf_path: str, page_count: int) -> Optional[List[str]]:
+    workers = _pool_workers(page_count, _PARALLEL_EXTRACT_MIN_PAGES)
+    if not workers:
+        return None
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    try:
+        with _process_pool(workers) as pool:
+            parts = pool.map(
+                _fitz_page_range,
+                [pdf_path] * len(starts),
+                starts,
+                [min(start + step, page_count) for start in starts],
             )
-        return doc.page_count
+            return [text for part in parts for text in part]
+    except Exception:
+        return None
+
+def _extract_pages_fitz(pdf_path: str, out_dir: Path) -> List[str]:
+    _ensure_dir(out_dir)
+    with fitz.open(pdf_path) as doc:
+        texts = _extract_fitz_parallel(pdf_path, doc.page_count)
+        if texts is None:
+            texts = [_fitz_page_text(pg) for pg in doc]
+    for i, text in enumerate(texts, start=1):
+        (out_dir / PAGE_FILE_FMT.format(i)).write_text(text, encoding="utf-8")
+    return texts
 
 # ---------- main ----------
 def create_toc(
@@ -165,6 +512,7 @@ def create_toc(
     *,
     debug_text: bool = False,
     max_debug_pages: Optional[int] = None,
+    prefer_fitz: bool = False,
 ) -> str:
     text_dir = Path(text_record_folder)
     _ensure_dir(text_dir)
@@ -178,76 +526,65 @@ def create_toc(
     for src_path in pdf_paths:
         with fitz.open(src_path) as src:
             merged.insert_pdf(src)
-    merged.save(combined_pdf_path, deflate=True, garbage=3)
+    # Intermediate file: pdfoutline's final save does the full garbage=3/deflate pass,
+    # so skip recompressing and xref compaction here.
+    merged.save(combined_pdf_path, deflate=False, garbage=1)
     total_pages = merged.page_count
     merged.close()
 
-    # 2) Extract per-page text (prefer Python binding with physical=True)
-    pages_done = _extract_pages_pdftotext_py(combined_pdf_path, text_dir)
-    if pages_done is None:
-        pages_done = _extract_pages_pdftotext_cli(combined_pdf_path, text_dir, total_pages)
-    if pages_done is None:
-        pages_done = _extract_pages_fitz(combined_pdf_path, text_dir)
+    # 2) Extract per-page text (prefer Python binding with physical=True;
+    #    prefer_fitz trades pdftotext's layout fidelity for PyMuPDF's speed).
+    #    Page files are still written for Copy Page Text and the Text Files view,
+    #    but the scan works from the returned strings.
+    page_texts = _extract_pages_fitz(combined_pdf_path, text_dir) if prefer_fitz else None
+    if page_texts is None:
+        page_texts = _extract_pages_pdftotext_py(combined_pdf_path, text_dir)
+    if page_texts is None:
+        page_texts = _extract_pages_pdftotext_cli(combined_pdf_path, text_dir, total_pages)
+    if page_texts is None:
+        page_texts = _extract_pages_fitz(combined_pdf_path, text_dir)
+    pages_done = len(page_texts)
 
     # 3) Load categories/patterns
     cat_files = _category_files(regexes_folder)
     if not cat_files:
         raise FileNotFoundError(f"No regex files found in: {regexes_folder}")
 
-    categories: Dict[str, List[Tuple[str, int]]] = {}
-    for p in cat_files:
-        categories[p.stem] = _load_category_file(p)
-
-    # 4) Read page texts
-    page_files = [text_dir / PAGE_FILE_FMT.format(i) for i in range(1, pages_done + 1)]
-    page_texts: List[str] = [pf.read_text(encoding="utf-8", errors="ignore") if pf.exists() else "" for pf in page_files]
+    categories, plans = _load_all_categories(str(regexes_folder), _fingerprint(cat_files))
 
-    # 5) Scan pages
-    from collections import defaultdict
-    results: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
-    seen: Dict[str, set] = {cat: set() for cat in categories}
+    # 4) Scan pages (pages are independent, so large documents fan out to a process pool)
+    page_hits = _scan_pages_parallel(page_texts, cat_files, update_progress)
+    if page_hits is None:
+        page_hits = _scan_pages(page_texts, categories, plans, update_progress)
 
-    def _run_pattern_on_text(pat_text: str, flags: int, text: str) -> List[str]:
-        hits: List[str] = []
-        try:
-            pat = re.compile(pat_text, flags)
-            for m in pat.finditer(text):
-                # Use first capture if present, else the whole match
-                s = (m.group(1) if m.lastindex else m.group(0)).strip()
-                if s:
-                    hits.append(s)
-        except re.error:
-            pass
-        return hits
-
-    for i, text in enumerate(page_texts, start=1):
-        for cat, pat_items in categories.items():
-            for pat_text, flags in pat_items:
-                for s in _run_pattern_on_text(pat_text, flags, text):
-                    key = (s, i)
-                    if key not in seen[cat]:
-                        results[cat].append((s, i))
-                        seen[cat].add(key)
-        if update_progress:
-            update_progress(i / max(1, pages_done))
+    # Parallel title/page columns per category instead of a tuple per hit
+    results: Dict[str, Tuple[List[str], array]] = {}
+    for i, hits in enumerate(page_hits, start=1):
+        for cat, titles in hits.items():
+            col = results.get(cat)
+            if col is None:
+                col = results[cat] = ([], array("I"))
+            col[0].extend(titles)
+            col[1].extend([i] * len(titles))
 
-    # 6) Build TOC (pad page numbers to 4 digits)
-    def _pad4(n: int) -> str: return f"{n:0{PAGE_PAD}d}"
+    # 5) Build TOC (pad page numbers to 4 digits; literal width, see PAGE_PAD)
     out_lines: List[str] = []
     for cat in sorted(categories.keys(), key=lambda s: s.lower()):  # match non-Flatpak ordering
-        cat_hits = sorted(results.get(cat, []), key=lambda t: t[1])
-        first_page = cat_hits[0][1] if cat_hits else 1
-        out_lines.append(f"{cat} {_pad4(first_page)}")
-        for title, pg in cat_hits:
-            out_lines.append(f"\t{title} {_pad4(pg)}")
+        titles, pages = results.get(cat, ((), ()))  # already in page order: pages are merged 1..N
+        first_page = pages[0] if pages else 1
+        out_lines.append(f"{cat} {first_page:04d}")
+        for title, pg in zip(titles, pages):
+            out_lines.append(f"\t{title} {pg:04d}")
         out_lines.append("")
 
     toc_text = "\n".join(out_lines) + "\n"
 
-    # 7) Write TOC file
+    # 6) Write TOC file
     if toc_file:
         os.makedirs(os.path.dirname(toc_file), exist_ok=True)
-        Path(toc_file).write_text(toc_text, encoding="utf-8")
+        # One encode and one write; the text layer adds nothing for a single blob.
+        with open(toc_file, "wb") as fh:
+            fh.write(toc_text.encode("utf-8"))
 
     return toc_text
 
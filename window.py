@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
 import os
+import queue
 import subprocess
 import threading
-from pathlib import Path
 
 import gi
 
@@ -15,13 +17,101 @@ from app_context import (
     APP_ID,
     APP_NAME,
     APP_VERSION,
+    DEBUG,
     AppContext,
+    DirWatch,
     dlog,
     dir_uri,
 )
 from copy_by_number import CopyByNumber
 import about_window
-from workflows import WorkflowRunner
+from workflows import WorkflowRunner, prime_imports
+
+
+# Registered from dogear.gresource by pdf_marker at startup. Kept out of the
+# application base path so Adw doesn't also auto-load it at its own priority.
+_CSS_RESOURCE = "/io/github/jessemcgowan/DogEar/css/style.css"
+
+# Large TOCs are fed into the buffer in slices so the main loop stays responsive.
+_LOAD_CHUNK = 1 << 16
+
+# Trailing debounce for editor saves: re-armed on every change, fires once typing pauses.
+_SAVE_DEBOUNCE_MS = 300
+
+# External saves arrive as bursts (write, close, rename); reload once they settle.
+_RELOAD_DEBOUNCE_MS = 100
+_RELOAD_EVENTS = frozenset(
+    (
+        Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+        Gio.FileMonitorEvent.CREATED,
+        Gio.FileMonitorEvent.RENAMED,
+        Gio.FileMonitorEvent.MOVED_IN,
+    )
+)
+# Only entries appearing or disappearing change the script chips.
+_SCRIPTS_EVENTS = frozenset(
+    (
+        Gio.FileMonitorEvent.CREATED,
+        Gio.FileMonitorEvent.DELETED,
+        Gio.FileMonitorEvent.RENAMED,
+        Gio.FileMonitorEvent.MOVED_IN,
+        Gio.FileMonitorEvent.MOVED_OUT,
+    )
+)
+
+
+class _DaemonPool:
+    """A few reusable daemon worker threads returning concurrent.futures Futures.
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so closing the
+    window mid Create TOC would leave a windowless process running until the
+    job finished. Daemon workers die with the process, as per-action threads did.
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        self._max_workers = max_workers
+        self._name = name
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._jobs.put((future, fn, args))
+        with self._lock:
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._work, name=f"{self._name}_{len(self._workers)}", daemon=True
+                )
+                self._workers.append(worker)
+                worker.start()
+        return future
+
+    def cancel_pending(self) -> None:
+        while True:
+            try:
+                future, _fn, _args = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            future.cancel()
+
+    def _work(self) -> None:
+        while True:
+            future, fn, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+
+# Shared workers for long-running actions, so clicks don't pay for thread spawns.
+_EXECUTOR = _DaemonPool(max_workers=4, name="dogear")
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 class DogEarWindow(Adw.ApplicationWindow):
@@ -29,26 +119,47 @@ class DogEarWindow(Adw.ApplicationWindow):
         dlog("DogEarWindow.__init__()")
         super().__init__(application=app, title=APP_NAME)
         self.add_css_class("rounded-window")
+        self.connect("close-request", self._on_close_request)
         self.set_default_size(980, 640)
 
         self.ctx = AppContext()
         self._saving_debounce_id: int | None = None
-        self._is_writing = False
-        self._last_disk_text = ""
+        self._reload_debounce_id: int | None = None
+        self._scripts_debounce_id: int | None = None
+        self._save_in_flight = False
+        self._save_again = False
+        self._save_dir_retried = False
+        self._after_save: list = []
+        self._last_disk_hash = _digest(b"")
+        # (ino, size, mtime_ns) of the file our last save produced.
+        self._self_write_stat: tuple[int, int, int] | None = None
+        self._load_generation = 0
+        self._buffer_loading = False
+        self._ui_lock = threading.Lock()
+        self._pending_ui_ops: list = []
+        self._pending_ui_id: int | None = None
+        self._pending_status: str | None = None
 
         self.runner = WorkflowRunner(
             self.ctx, self._set_status, self._load_toc_from_disk, self._reset_toc_file
         )
 
-        # Load CSS (non-fatal if missing)
+        # Load CSS (non-fatal if missing). The build bundles style.css into
+        # dogear.gresource; the on-disk file is only a fallback.
         try:
-            css_path = os.path.join(self.ctx.share_root, "style.css")
             provider = Gtk.CssProvider()
-            provider.load_from_path(css_path)
+            try:
+                Gio.resources_get_info(_CSS_RESOURCE, Gio.ResourceLookupFlags.NONE)
+            except GLib.Error:
+                css_path = os.path.join(self.ctx.share_root, "style.css")
+                provider.load_from_path(css_path)
+                dlog(f"Loaded CSS: {css_path}")
+            else:
+                provider.load_from_resource(_CSS_RESOURCE)
+                dlog("Loaded CSS from GResource")
             Gtk.StyleContext.add_provider_for_display(
                 Gdk.Display.get_default(), provider, Gtk.STYLE_PROVIDER_PRIORITY_USER
             )
-            dlog(f"Loaded CSS: {css_path}")
         except Exception as exc:
             dlog(f"CSS load failed: {exc}")
 
@@ -58,12 +169,12 @@ class DogEarWindow(Adw.ApplicationWindow):
         os.environ["PDFMARKER_TEXT_PAGES_DIR"] = self.ctx.shm_text_dir
 
         self._reset_toc_file()
-        if not os.path.exists(self.ctx.toc_file_path):
-            Path(self.ctx.toc_file_path).write_text("", encoding="utf-8")
+        self._toc_gfile = Gio.File.new_for_path(self.ctx.toc_file_path)
 
         # ── UI layout ──────────────────────────────────────────────────────
         toolbar_view = Adw.ToolbarView()
         self.set_content(toolbar_view)
+        prime_imports()
 
         header = Adw.HeaderBar()
 
@@ -77,6 +188,13 @@ class DogEarWindow(Adw.ApplicationWindow):
         self.plus_btn.add_css_class("flat")
         self.plus_btn.connect("clicked", self._on_plus_clicked)
         header.pack_start(self.plus_btn)
+        # Built up front so the first click doesn't stall, and so the
+        # accelerators work before the menu has ever been opened.
+        self._ensure_plus_menu_actions()
+        self.plus_menu = self._build_plus_menu()
+        self.plus_menu.set_parent(self.plus_btn)
+        self.plus_menu.set_has_arrow(True)
+        self.plus_menu.set_autohide(True)
 
         self.menu_btn = Gtk.MenuButton(icon_name="open-menu-symbolic")
         self._ensure_app_menu_actions()
@@ -144,6 +262,9 @@ class DogEarWindow(Adw.ApplicationWindow):
 
         self.scripts_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         header_row.append(self.scripts_box)
+        self._scripts_current: list[str] | None = None
+        self._script_buttons: dict[str, Gtk.Button] = {}
+        self._scripts_hint: Gtk.Label | None = None
         self._rebuild_script_buttons()
 
         scroller = Gtk.ScrolledWindow()
@@ -188,14 +309,37 @@ class DogEarWindow(Adw.ApplicationWindow):
             self._set_status("First run: added " + " and ".join(msgs) + ".")
 
         self._load_toc_from_disk()
-        self._toc_gfile = Gio.File.new_for_path(self.ctx.toc_file_path)
+        self._toc_watch: DirWatch | None = None
+        self._toc_monitor: Gio.FileMonitor | None = None
         try:
-            self._toc_monitor = self._toc_gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
-            self._toc_monitor.connect("changed", self._on_toc_file_changed)
-            dlog("File monitor armed")
+            # Raw inotify on the TOC dir: one read per wakeup, finished writes only.
+            self._toc_watch = DirWatch(
+                self.ctx.shm_toc_dir,
+                (os.path.basename(self.ctx.toc_file_path),),
+                self._schedule_toc_reload,
+            )
+            dlog("inotify watch armed")
         except Exception as exc:
-            dlog(f"File monitor failed: {exc}")
-            self._toc_monitor = None
+            dlog(f"inotify watch failed: {exc}")
+        if self._toc_watch is None:
+            try:
+                self._toc_monitor = self._toc_gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
+                # Let GIO coalesce bursts of CHANGED events; self-writes are
+                # recognised in _reload_toc_if_changed.
+                self._toc_monitor.set_rate_limit(100)
+                self._toc_monitor.connect("changed", self._on_toc_file_changed)
+                dlog("File monitor armed")
+            except Exception as exc:
+                dlog(f"File monitor failed: {exc}")
+                self._toc_monitor = None
+        try:
+            self._scripts_monitor = Gio.File.new_for_path(self.ctx.user_post_dir).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+            self._scripts_monitor.connect("changed", self._on_scripts_dir_changed)
+        except Exception as exc:
+            dlog(f"Scripts monitor failed: {exc}")
+            self._scripts_monitor = None
 
         dlog("DogEarWindow constructed")
 
@@ -271,18 +415,33 @@ class DogEarWindow(Adw.ApplicationWindow):
         menu.append_section(None, sec)
         return Gtk.PopoverMenu.new_from_model(menu)
 
-    def _on_plus_clicked(self, button: Gtk.Button) -> None:
-        if not hasattr(self, "plus_menu"):
-            self._ensure_plus_menu_actions()
-            self.plus_menu = self._build_plus_menu()
-            self.plus_menu.set_parent(button)
-            self.plus_menu.set_has_arrow(True)
-            self.plus_menu.set_autohide(True)
+    def _on_plus_clicked(self, _button: Gtk.Button) -> None:
         self.plus_menu.popup()
 
+    def _on_close_request(self, *_args) -> bool:
+        # Queued actions are dropped and a running script is stopped; the
+        # daemon workers themselves end with the process.
+        _EXECUTOR.cancel_pending()
+        self.runner.terminate_script()
+        if self._toc_watch is not None:
+            self._toc_watch.close()
+            self._toc_watch = None
+        return False
+
+    def _submit(self, fn, *args) -> None:
+        _EXECUTOR.submit(fn, *args).add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, future: concurrent.futures.Future) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            dlog(f"Worker failed: {exc!r}")
+            self._set_status(f"Action failed: {exc}")
+
     # ── Plus-menu handlers ─────────────────────────────────────────────---
     def _on_clear_input(self, *_args) -> None:
-        threading.Thread(target=self.runner.clear_input, daemon=True).start()
+        self._submit(self.runner.clear_input)
 
     def _on_add_pdfs(self, *_args) -> None:
         dialog = Gtk.FileDialog()
@@ -302,102 +461,329 @@ class DogEarWindow(Adw.ApplicationWindow):
 
             paths = [gfile.get_path() or "" for gfile in files]
 
-            threading.Thread(
-                target=self.runner.copy_pdfs_into_input,
-                args=(paths,),
-                daemon=True,
-            ).start()
+            self._submit(self.runner.copy_pdfs_into_input, paths)
 
         dialog.open_multiple(self, None, finished)
 
     # ── Status helpers ─────────────────────────────────────────────────---
+    def _ui(self, fn) -> None:
+        """Run fn on the main loop.
+
+        Main-loop callers run immediately unless earlier work is still queued;
+        everything else is batched into a single idle callback.
+        """
+        with self._ui_lock:
+            if self._pending_ui_id is None and GLib.main_context_default().is_owner():
+                queued = False
+            else:
+                queued = True
+                self._pending_ui_ops.append(fn)
+                if self._pending_ui_id is None:
+                    self._pending_ui_id = GLib.idle_add(
+                        self._flush_ui, priority=GLib.PRIORITY_DEFAULT_IDLE
+                    )
+        if not queued:
+            fn()
+
+    def _flush_ui(self) -> bool:
+        with self._ui_lock:
+            ops, self._pending_ui_ops = self._pending_ui_ops, []
+            self._pending_ui_id = None
+        for fn in ops:
+            try:
+                fn()
+            except Exception as exc:
+                dlog(f"UI update failed: {exc}")
+        return False
+
     def _set_status(self, text: str) -> None:
-        dlog(f"STATUS: {text}")
-        GLib.idle_add(self.status.set_text, text)
+        if DEBUG:
+            # Scripts report progress through here; skip the f-string otherwise.
+            dlog(f"STATUS: {text}")
+        # Bursts collapse to the latest text: only the first update of a burst
+        # queues a flush, later ones just replace what it will show.
+        with self._ui_lock:
+            queued = self._pending_status is not None
+            self._pending_status = text
+        if not queued:
+            self._ui(self._flush_status)
+
+    def _flush_status(self) -> None:
+        with self._ui_lock:
+            text, self._pending_status = self._pending_status, None
+        if text is not None:
+            self.status.set_text(text)
 
     def _begin_action(self, which: str) -> None:
-        label = self.lbl_toc_status if which == "toc" else self.lbl_bm_status
-        spinner = self.spinner_toc if which == "toc" else self.spinner_bm
-        label.set_text("")
-        spinner.start()
-        self.row_toc.set_sensitive(False)
-        self.row_bm.set_sensitive(False)
+        def update() -> None:
+            label = self.lbl_toc_status if which == "toc" else self.lbl_bm_status
+            spinner = self.spinner_toc if which == "toc" else self.spinner_bm
+            label.set_text("")
+            spinner.start()
+            self.row_toc.set_sensitive(False)
+            self.row_bm.set_sensitive(False)
+
+        self._ui(update)
 
     def _finish_action(self, which: str, status: str) -> None:
-        def update() -> bool:
+        def update() -> None:
             label = self.lbl_toc_status if which == "toc" else self.lbl_bm_status
             spinner = self.spinner_toc if which == "toc" else self.spinner_bm
             label.set_text(status)
             spinner.stop()
             self.row_toc.set_sensitive(True)
             self.row_bm.set_sensitive(True)
-            return False
 
-        GLib.idle_add(update)
+        self._ui(update)
 
     def _reset_toc_file(self) -> None:
         self.ctx.reset_toc_file()
 
-    def _read_disk_text(self) -> str:
+    def _read_toc_async(self, on_text) -> None:
+        """Read the TOC on GIO's worker and hand the text to on_text on the main loop."""
+        self._toc_gfile.load_contents_async(None, self._on_toc_loaded, on_text)
+
+    def _on_toc_loaded(self, gfile: Gio.File, result: Gio.AsyncResult, on_text) -> None:
         try:
-            return Path(self.ctx.toc_file_path).read_text(encoding="utf-8")
-        except FileNotFoundError:
-            return ""
+            _ok, data, _etag = gfile.load_contents_finish(result)
+            text = data.decode("utf-8")
+        except GLib.Error as exc:
+            if not exc.matches(Gio.io_error_quark(), Gio.IOErrorEnum.NOT_FOUND):
+                self._set_status(f"Read failed: {exc.message}")
+                return
+            text = ""
         except Exception as exc:
             self._set_status(f"Read failed: {exc}")
-            return ""
+            return
+        on_text(text)
 
     def _load_toc_from_disk(self, *_args) -> None:
-        text = self._read_disk_text()
-        self._last_disk_text = text
-        GLib.idle_add(self.textbuffer.set_text, text)
+        # Also called from workflow threads; start the read from the main loop.
+        self._ui(lambda: self._read_toc_async(self._apply_disk_text))
+
+    def _apply_disk_text(self, text: str, digest: bytes | None = None) -> None:
+        self._last_disk_hash = digest or _digest(text.encode("utf-8"))
+        self._ui(lambda: self._set_buffer_text(text))
         self._set_status("Loaded TOC.")
 
+    def _set_buffer_text(self, text: str) -> bool:
+        self._load_generation += 1
+        # Reloads touch only the span that changed, so marks (cursor,
+        # selection) and the layout of untouched lines survive. A large
+        # rewrite (e.g. a fresh Create TOC) still goes through the sliced load.
+        if self.textbuffer.get_char_count() and self._replace_changed_span(text):
+            self._end_buffer_load()
+            return False
+        if len(text) <= _LOAD_CHUNK:
+            self.textbuffer.set_text(text)
+            self._end_buffer_load()
+            return False
+        # Saves are held off until the last slice lands (see _write_buffer_to_disk),
+        # so the editor is read-only meanwhile: edits made now would never be saved.
+        self._buffer_loading = True
+        self.textview.set_editable(False)
+        self.textbuffer.set_text("")
+        GLib.idle_add(self._feed_buffer, text, 0, self._load_generation)
+        return False
+
+    def _feed_buffer(self, text: str, offset: int, generation: int) -> bool:
+        if generation != self._load_generation:
+            return False  # superseded by a newer load
+        chunk = text[offset:offset + _LOAD_CHUNK]
+        if chunk:
+            buf = self.textbuffer
+            # Like set_text, a slice is not an undo step; Ctrl+Z must not
+            # strip part of a freshly loaded TOC.
+            buf.begin_irreversible_action()
+            try:
+                buf.insert(buf.get_end_iter(), chunk)
+            finally:
+                buf.end_irreversible_action()
+            GLib.idle_add(self._feed_buffer, text, offset + _LOAD_CHUNK, generation)
+        else:
+            self._end_buffer_load()
+        return False
+
+    def _end_buffer_load(self) -> None:
+        self._buffer_loading = False
+        self.textview.set_editable(True)
+        # Matches disk now; clears GTK's modified flag so the debounce skips it.
+        self.textbuffer.set_modified(False)
+
+    def _replace_changed_span(self, new: str) -> bool:
+        """Edit the buffer into `new` in place; False if the change is too big for one step."""
+        old = self._buffer_text()
+        if old == new:
+            return True
+        prefix = len(os.path.commonprefix((old, new)))
+        suffix = len(os.path.commonprefix((old[prefix:][::-1], new[prefix:][::-1])))
+        middle = new[prefix:len(new) - suffix]
+        if len(middle) > _LOAD_CHUNK:
+            return False
+        buf = self.textbuffer
+        # Like set_text, a reload is not an undo step.
+        buf.begin_irreversible_action()
+        try:
+            if len(old) - suffix > prefix:
+                buf.delete(buf.get_iter_at_offset(prefix), buf.get_iter_at_offset(len(old) - suffix))
+            if middle:
+                buf.insert(buf.get_iter_at_offset(prefix), middle)
+        finally:
+            buf.end_irreversible_action()
+        return True
+
     def _buffer_text(self) -> str:
         start, end = self.textbuffer.get_start_iter(), self.textbuffer.get_end_iter()
         return self.textbuffer.get_text(start, end, False)
 
+    def _buffer_chunks(self) -> list[bytes]:
+        """Encode the buffer in _LOAD_CHUNK-character slices, never as one str."""
+        buf = self.textbuffer
+        total = buf.get_char_count()
+        chunks: list[bytes] = []
+        start = buf.get_start_iter()
+        for offset in range(_LOAD_CHUNK, total + _LOAD_CHUNK, _LOAD_CHUNK):
+            end = buf.get_iter_at_offset(min(offset, total))
+            chunks.append(buf.get_text(start, end, False).encode("utf-8"))
+            start = end
+        return chunks
+
     def _write_buffer_to_disk(self) -> bool:
         self._saving_debounce_id = None
-        text = self._buffer_text()
-        if text == self._last_disk_text:
+        if self._save_in_flight:
+            # Picked up again when the current write completes.
+            self._save_again = True
+            return False
+        if self._buffer_loading or not self.textbuffer.get_modified():
+            self._run_after_save()
             return False
+        chunks = self._buffer_chunks()
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in chunks:
+            hasher.update(chunk)
+        digest = hasher.digest()
+        if digest == self._last_disk_hash:
+            # Edited back to what is on disk: no joined copy, no write.
+            self.textbuffer.set_modified(False)
+            self._run_after_save()
+            return False
+        data = b"".join(chunks)
+        del chunks
         try:
-            self._is_writing = True
-            Path(self.ctx.shm_toc_dir).mkdir(parents=True, exist_ok=True)
-            Path(self.ctx.toc_file_path).write_text(text, encoding="utf-8")
-            self._last_disk_text = text
-            self._set_status("Saved TOC.")
+            self.ctx.ensure_dir(self.ctx.shm_toc_dir)
         except Exception as exc:
+            # Still modified, so the next edit or action retries the save.
             self._set_status(f"Save failed: {exc}")
-        finally:
-            GLib.timeout_add(150, self._clear_is_writing)
+            self._run_after_save()
+            return False
+        self.textbuffer.set_modified(False)
+        # GIO writes a temp file and renames it over the TOC off the main loop,
+        # so the monitor never sees a half-written file. The digest is recorded
+        # up front so the resulting monitor event is recognised as our own.
+        previous = self._last_disk_hash
+        self._last_disk_hash = digest
+        self._save_in_flight = True
+        self._toc_gfile.replace_contents_bytes_async(
+            GLib.Bytes.new(data),
+            None,
+            False,
+            Gio.FileCreateFlags.REPLACE_DESTINATION,
+            None,
+            self._on_toc_written,
+            previous,
+        )
         return False
 
-    def _write_buffer_to_disk_immediate(self) -> None:
+    def _on_toc_written(self, gfile: Gio.File, result: Gio.AsyncResult, previous: bytes) -> None:
+        self._save_in_flight = False
+        try:
+            gfile.replace_contents_finish(result)
+            self._self_write_stat = self._toc_stat()
+            self._save_dir_retried = False
+            self._set_status("Saved TOC.")
+        except Exception as exc:
+            self._last_disk_hash = previous
+            self.textbuffer.set_modified(True)
+            if (
+                isinstance(exc, GLib.Error)
+                and exc.matches(Gio.io_error_quark(), Gio.IOErrorEnum.NOT_FOUND)
+                and not self._save_dir_retried
+            ):
+                # The TOC dir was deleted under us: recreate it and retry once.
+                self._save_dir_retried = True
+                try:
+                    self.ctx.ensure_dir(self.ctx.shm_toc_dir, fresh=True)
+                    self._save_again = True
+                except Exception as mkdir_exc:
+                    self._set_status(f"Save failed: {mkdir_exc}")
+            else:
+                self._set_status(f"Save failed: {exc}")
+        if self._save_again:
+            self._save_again = False
+            self._write_buffer_to_disk()
+        else:
+            self._run_after_save()
+
+    def _run_after_save(self) -> None:
+        callbacks, self._after_save = self._after_save, []
+        for callback in callbacks:
+            callback()
+
+    def _save_then(self, callback) -> None:
+        """Flush any pending edit to disk, then run callback (on the main loop)."""
         if self._saving_debounce_id is not None:
             GLib.source_remove(self._saving_debounce_id)
             self._saving_debounce_id = None
+        self._after_save.append(callback)
         self._write_buffer_to_disk()
 
-    def _clear_is_writing(self) -> bool:
-        self._is_writing = False
-        return False
-
     def _on_buffer_changed(self, *_args) -> None:
         if self._saving_debounce_id is not None:
             GLib.source_remove(self._saving_debounce_id)
-        self._saving_debounce_id = GLib.timeout_add(300, self._write_buffer_to_disk)
+        self._saving_debounce_id = GLib.timeout_add(_SAVE_DEBOUNCE_MS, self._write_buffer_to_disk)
+
+    def _on_toc_file_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        _file: Gio.File,
+        _other_file: Gio.File | None,
+        event_type: Gio.FileMonitorEvent,
+    ) -> None:
+        if event_type in _RELOAD_EVENTS:
+            self._schedule_toc_reload()
+
+    def _schedule_toc_reload(self) -> None:
+        if self._reload_debounce_id is not None:
+            GLib.source_remove(self._reload_debounce_id)
+        self._reload_debounce_id = GLib.timeout_add(_RELOAD_DEBOUNCE_MS, self._reload_toc_if_changed)
+
+    def _toc_stat(self) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(self.ctx.toc_file_path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _reload_toc_if_changed(self) -> bool:
+        self._reload_debounce_id = None
+        stat = self._toc_stat()
+        if stat is not None and stat == self._self_write_stat:
+            # Still exactly the file our own save renamed into place.
+            return False
+        self._read_toc_async(self._apply_if_changed)
+        return False
 
-    def _on_toc_file_changed(self, *_args) -> None:
-        if self._is_writing:
+    def _apply_if_changed(self, text: str) -> None:
+        digest = _digest(text.encode("utf-8"))
+        if digest == self._last_disk_hash:
+            # Our own save (or a no-op touch); nothing to reload.
             return
-        self._load_toc_from_disk()
+        self._apply_disk_text(text, digest)
 
     # ── Long-running actions ─────────────────────────────────────────────-
     def _on_row_create_toc(self, *_args) -> None:
         self._begin_action("toc")
-        threading.Thread(target=self._run_create_toc, daemon=True).start()
+        self._submit(self._run_create_toc)
 
     def _run_create_toc(self) -> None:
         try:
@@ -409,11 +795,10 @@ class DogEarWindow(Adw.ApplicationWindow):
 
     def _on_row_create_bookmarks(self, *_args) -> None:
         self._begin_action("bm")
-        threading.Thread(target=self._run_create_bookmarks, daemon=True).start()
+        self._save_then(lambda: self._submit(self._run_create_bookmarks))
 
     def _run_create_bookmarks(self) -> None:
         try:
-            self._write_buffer_to_disk_immediate()
             self.runner.create_bookmarks()
             self._finish_action("bm", "Done")
         except Exception as exc:
@@ -422,34 +807,61 @@ class DogEarWindow(Adw.ApplicationWindow):
 
     # ── File operations ─────────────────────────────────────────────────--
     def _rebuild_script_buttons(self) -> None:
-        child = self.scripts_box.get_first_child()
-        while child is not None:
-            nxt = child.get_next_sibling()
-            self.scripts_box.remove(child)
-            child = nxt
-
         scripts = self.ctx.list_post_scripts()
+        if scripts == self._scripts_current:
+            return
+        self._scripts_current = scripts
+
         if not scripts:
-            hint = Gtk.Label(label="(Place .sh or .py in Post Scripts)", xalign=0)
-            self.scripts_box.append(hint)
+            for button in self._script_buttons.values():
+                self.scripts_box.remove(button)
+            self._script_buttons.clear()
+            if self._scripts_hint is None:
+                self._scripts_hint = Gtk.Label(label="(Place .sh or .py in Post Scripts)", xalign=0)
+                self.scripts_box.append(self._scripts_hint)
             return
 
+        if self._scripts_hint is not None:
+            self.scripts_box.remove(self._scripts_hint)
+            self._scripts_hint = None
+
+        wanted = set(scripts)
+        for script_path in [p for p in self._script_buttons if p not in wanted]:
+            self.scripts_box.remove(self._script_buttons.pop(script_path))
+
+        # Only build buttons for new scripts, inserting each in sorted position.
+        prev: Gtk.Widget | None = None
         for script_path in scripts:
-            base = os.path.basename(script_path)
-            label, _ext = os.path.splitext(base)
-            button = Gtk.Button(label=label)
-            button.add_css_class("script-chip")
-            button.set_tooltip_text(f"Run {base} in the TOC folder")
-            button.connect("clicked", self._on_run_script_clicked, script_path)
-            self.scripts_box.append(button)
+            button = self._script_buttons.get(script_path)
+            if button is None:
+                button = self._make_script_button(script_path)
+                self._script_buttons[script_path] = button
+                self.scripts_box.insert_child_after(button, prev)
+            prev = button
+
+    def _on_scripts_dir_changed(self, _monitor, _file, _other, event_type) -> None:
+        if event_type not in _SCRIPTS_EVENTS:
+            return
+        if self._scripts_debounce_id is not None:
+            GLib.source_remove(self._scripts_debounce_id)
+        self._scripts_debounce_id = GLib.timeout_add(_RELOAD_DEBOUNCE_MS, self._refresh_script_buttons)
+
+    def _refresh_script_buttons(self) -> bool:
+        self._scripts_debounce_id = None
+        self._rebuild_script_buttons()
+        return False
+
+    def _make_script_button(self, script_path: str) -> Gtk.Button:
+        base = os.path.basename(script_path)
+        label, _ext = os.path.splitext(base)
+        button = Gtk.Button(label=label)
+        button.add_css_class("script-chip")
+        button.set_tooltip_text(f"Run {base} in the TOC folder")
+        button.connect("clicked", self._on_run_script_clicked, script_path)
+        return button
 
     def _on_run_script_clicked(self, _button: Gtk.Button, script_path: str) -> None:
-        self._write_buffer_to_disk_immediate()
-        threading.Thread(
-            target=self.runner.run_script_in_toc_dir,
-            args=(script_path,),
-            daemon=True,
-        ).start()
+        self._save_then(lambda: self._submit(self.runner.run_script_in_toc_dir, script_path))
 
     def _open_path(self, _button, path: str, refresh_from: str | None = None) -> None:
         try:
@@ -512,7 +924,7 @@ class DogEarWindow(Adw.ApplicationWindow):
 
     def _on_copy_regex_pattern(self, *_args) -> None:
         pattern = r"\A(?=[\s\S]*HELPER_PATTERN)[\s\S]*?(TARGET_PATTERN)"
-        CopyByNumber._copy_text_async(self, pattern, verify=False)
+        CopyByNumber._copy_text_simple(self, pattern)
 
     def _on_about(self, *_args) -> None:
         about_window.show_about_default(
@@ -4,12 +4,205 @@ import os
 import shutil
 import subprocess
 import sys
-from pathlib import Path
-from typing import Callable, Iterable
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Callable, Iterable, TypeVar
 
-from app_context import AppContext
-from pdfoutline_mod import pdfoutline
-import toc_creator
+from app_context import AppContext, dlog, fast_copy
+
+
+# toc_creator and pdfoutline_mod pull in PyMuPDF, so they are imported on a
+# background thread (see prime_imports) rather than before the window shows.
+_lazy: dict[str, object] = {}
+_prime_thread: threading.Thread | None = None
+
+
+def _prime_imports() -> None:
+    try:
+        import toc_creator
+        from pdfoutline_mod import pdfoutline
+
+        _lazy["toc_creator"] = toc_creator
+        _lazy["pdfoutline"] = pdfoutline
+        dlog("PDF backends imported")
+    except Exception as exc:
+        dlog(f"Background import failed: {exc}")
+
+
+def prime_imports() -> None:
+    """Start importing the PDF backends on a daemon thread (idempotent)."""
+    global _prime_thread
+    if _prime_thread is None:
+        _prime_thread = threading.Thread(target=_prime_imports, name="dogear-prime", daemon=True)
+        _prime_thread.start()
+
+
+def _wait_for_prime() -> None:
+    if _prime_thread is not None and _prime_thread.is_alive():
+        _prime_thread.join()
+
+
+def _get_toc_creator():
+    _wait_for_prime()
+    if "toc_creator" not in _lazy:
+        import toc_creator
+
+        _lazy["toc_creator"] = toc_creator
+    return _lazy["toc_creator"]
+
+
+def _get_pdfoutline():
+    _wait_for_prime()
+    if "pdfoutline" not in _lazy:
+        from pdfoutline_mod import pdfoutline
+
+        _lazy["pdfoutline"] = pdfoutline
+    return _lazy["pdfoutline"]
+
+
+_RSYNC = shutil.which("rsync")
+# unlink releases the GIL, so a large per-page wipe parallelises well.
+_UNLINK_WORKERS = min(16, os.cpu_count() or 4)
+_PARALLEL_UNLINK_MIN = 64
+# Script output is streamed; only the last few lines of each pipe are kept.
+_SCRIPT_TAIL_LINES = 40
+_SCRIPT_STATUS_INTERVAL = 0.1
+
+
+def _same_file_contents(src: str, dst: str) -> bool:
+    """Cheap check that dst is already a copy of src (size + exact mtime).
+
+    fast_copy preserves mtime, so a real copy matches exactly; an older source
+    restored with its original timestamp must still replace dst.
+    """
+    try:
+        s_st = os.stat(src)
+        d_st = os.stat(dst)
+    except OSError:
+        return False
+    return d_st.st_size == s_st.st_size and d_st.st_mtime_ns == s_st.st_mtime_ns
+
+
+def _safe_unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except Exception:
+        pass
+
+
+def _remove_if_present(path: str) -> None:
+    # Cheaper than an exists() stat followed by the remove.
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _wipe_dir(folder: str) -> None:
+    """Delete everything inside folder, leaving the folder itself in place."""
+    files: list[str] = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            # d_type from getdents: no extra stat per entry.
+            if not entry.is_dir(follow_symlinks=False):
+                files.append(entry.path)
+                continue
+            try:
+                shutil.rmtree(entry.path)
+            except Exception:
+                pass
+    if len(files) < _PARALLEL_UNLINK_MIN:
+        for path in files:
+            _safe_unlink(path)
+        return
+    with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+        list(pool.map(_safe_unlink, files))
+
+
+def _drain_pipe(pipe, tail: deque, on_line: Callable[[str], None] | None = None) -> None:
+    """Read pipe to EOF, keeping only the last tail.maxlen lines."""
+    with pipe:
+        for line in pipe:
+            line = line.rstrip("\n")
+            tail.append(line)
+            if on_line is not None and line:
+                on_line(line)
+
+
+def _sync_tree(src: str, dst: str, link: bool = False) -> None:
+    """Make dst mirror src, removing only entries that no longer exist in src.
+
+    Like rsync's quick check, files whose size and mtime already match
+    (fast_copy preserves mtime) are left alone. With link=True (src and dst
+    on one filesystem) files are hardlinked rather than copied, so dst holds
+    inode aliases of src and an in-place edit on either side shows on both.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        src_entries = {entry.name: entry for entry in it}
+    # name -> True for a real directory, False for anything else
+    dst_is_dir: dict[str, bool] = {}
+    dst_files: dict[str, os.DirEntry] = {}
+    with os.scandir(dst) as it:
+        for entry in it:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if entry.name in src_entries:
+                dst_is_dir[entry.name] = is_dir
+                if not is_dir:
+                    dst_files[entry.name] = entry
+                continue
+            try:
+                if is_dir:
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except Exception:
+                pass
+    for name, entry in src_entries.items():
+        target = os.path.join(dst, name)
+        existing = dst_is_dir.get(name)
+        try:
+            if entry.is_dir():
+                if existing is False:
+                    os.unlink(target)
+                _sync_tree(entry.path, target, link)
+            else:
+                if existing:
+                    shutil.rmtree(target)
+                elif name in dst_files:
+                    s_st = entry.stat()
+                    d_st = dst_files[name].stat()
+                    if d_st.st_size == s_st.st_size and d_st.st_mtime_ns == s_st.st_mtime_ns:
+                        continue
+                    # The old target may be a hardlink to a src inode; writing
+                    # through it (fast_copy truncates) would clobber the source.
+                    os.unlink(target)
+                if link:
+                    try:
+                        os.link(entry.path, target)
+                        continue
+                    except OSError:
+                        pass
+                fast_copy(entry.path, target)
+        except Exception:
+            pass
+
+
+_F = TypeVar("_F", bound=Callable[..., object])
+
+
+def _exclusive(method: _F) -> _F:
+    """Serialise a runner operation against the other exclusive ones."""
+
+    @wraps(method)
+    def wrapper(self: "WorkflowRunner", *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
 
 
 class WorkflowRunner:
@@ -26,45 +219,37 @@ class WorkflowRunner:
         self._set_status = set_status
         self._load_toc = load_toc
         self._reset_toc = reset_toc
+        # Clear Input racing a Create TOC (or a script) would pull files out
+        # from under it, so the operations that touch the working dirs queue.
+        self._lock = threading.Lock()
+        self._script_process: subprocess.Popen | None = None
+
+    def _in_dir(self, folder: str, fn: Callable, *args):
+        """Run fn(*args); if it fails because folder vanished after ensure_dir
+        cached it, recreate folder and retry once."""
+        try:
+            return fn(*args)
+        except Exception:
+            if os.path.isdir(folder):
+                raise
+            self._ctx.ensure_dir(folder, fresh=True)
+            return fn(*args)
 
     # ── Input management ─────────────────────────────────────────────────--
+    @_exclusive
     def clear_input(self) -> None:
         """Clear the Input directory and transient artifacts."""
         try:
-            Path(self._ctx.input_folder).mkdir(parents=True, exist_ok=True)
-            for entry in list(Path(self._ctx.input_folder).iterdir()):
-                try:
-                    if entry.is_file() or entry.is_symlink():
-                        entry.unlink()
-                    else:
-                        shutil.rmtree(entry)
-                except Exception:
-                    pass
+            self._ctx.ensure_dir(self._ctx.input_folder)
+            self._in_dir(self._ctx.input_folder, _wipe_dir, self._ctx.input_folder)
 
-            try:
-                if os.path.exists(self._ctx.combined_pdf_path):
-                    os.remove(self._ctx.combined_pdf_path)
-            except Exception:
-                pass
-
-            try:
-                if os.path.exists(self._ctx.completed_record_pdf):
-                    os.remove(self._ctx.completed_record_pdf)
-            except Exception:
-                pass
+            _remove_if_present(self._ctx.combined_pdf_path)
+            _remove_if_present(self._ctx.completed_record_pdf)
 
             for folder in (self._ctx.shm_text_dir, self._ctx.host_view_text, self._ctx.completed_host):
                 try:
-                    path_obj = Path(folder)
-                    path_obj.mkdir(parents=True, exist_ok=True)
-                    for entry in list(path_obj.iterdir()):
-                        try:
-                            if entry.is_file() or entry.is_symlink():
-                                entry.unlink()
-                            else:
-                                shutil.rmtree(entry)
-                        except Exception:
-                            pass
+                    self._ctx.ensure_dir(folder)
+                    self._in_dir(folder, _wipe_dir, folder)
                 except Exception:
                     pass
 
@@ -74,19 +259,28 @@ class WorkflowRunner:
         except Exception as exc:
             self._set_status(f"Clear Input failed: {exc}")
 
+    @_exclusive
     def copy_pdfs_into_input(self, file_paths: Iterable[str]) -> None:
         try:
-            Path(self._ctx.input_folder).mkdir(parents=True, exist_ok=True)
-            count = 0
-            for path in file_paths:
-                if not path or not path.lower().endswith(".pdf"):
-                    continue
+            self._ctx.ensure_dir(self._ctx.input_folder)
+            # Same-named PDFs from different folders would race on one dst;
+            # keep the last, as the old sequential copy effectively did.
+            by_name = {os.path.basename(p): p for p in file_paths if p and p.lower().endswith(".pdf")}
+            sources = list(by_name.values())
+
+            def copy_one(path: str) -> bool:
                 try:
                     dst = os.path.join(self._ctx.input_folder, os.path.basename(path))
-                    shutil.copy2(path, dst)
-                    count += 1
+                    if _same_file_contents(path, dst):
+                        return True
+                    self._in_dir(self._ctx.input_folder, fast_copy, path, dst)
+                    return True
                 except Exception:
-                    pass
+                    return False
+
+            # Each copy is independent; a few workers overlap the I/O.
+            with ThreadPoolExecutor(max_workers=min(4, len(sources) or 1)) as pool:
+                count = sum(pool.map(copy_one, sources))
 
             if count == 0:
                 self._set_status("No PDFs added.")
@@ -96,6 +290,7 @@ class WorkflowRunner:
             self._set_status(f"Add PDFs failed: {exc}")
 
     # ── TOC + bookmark generation ─────────────────────────────────────────
+    @_exclusive
     def create_toc(self) -> None:
         for folder in (
             self._ctx.shm_root,
@@ -104,29 +299,16 @@ class WorkflowRunner:
             self._ctx.shm_completed_dir,
             self._ctx.input_folder,
         ):
-            Path(folder).mkdir(parents=True, exist_ok=True)
+            self._ctx.ensure_dir(folder)
 
-        try:
-            if os.path.exists(self._ctx.combined_pdf_path):
-                os.remove(self._ctx.combined_pdf_path)
-        except Exception:
-            pass
+        _remove_if_present(self._ctx.combined_pdf_path)
 
         try:
-            text_dir = Path(self._ctx.shm_text_dir)
-            if text_dir.exists():
-                for item in list(text_dir.iterdir()):
-                    try:
-                        if item.is_file() or item.is_symlink():
-                            item.unlink()
-                        elif item.is_dir():
-                            shutil.rmtree(item)
-                    except Exception:
-                        pass
+            _wipe_dir(self._ctx.shm_text_dir)
         except Exception:
             pass
 
-        toc_creator.create_toc(
+        _get_toc_creator().create_toc(
             text_record_folder=self._ctx.shm_text_dir,
             input_folder=self._ctx.input_folder,
             combined_pdf_path=self._ctx.combined_pdf_path,
@@ -136,19 +318,24 @@ class WorkflowRunner:
         )
 
         self._load_toc()
-        self.mirror_tree(self._ctx.shm_text_dir, self._ctx.host_view_text)
+        self.mirror_tree(self._ctx.shm_text_dir, self._ctx.host_view_text, link=True)
 
+    @_exclusive
     def create_bookmarks(self) -> None:
-        Path(self._ctx.shm_completed_dir).mkdir(parents=True, exist_ok=True)
-        pdfoutline(
-            inpdf=self._ctx.combined_pdf_path,
-            tocfile=self._ctx.toc_file_path,
-            outpdf=self._ctx.completed_record_pdf,
-            update_progress=lambda fraction: None,
+        self._ctx.ensure_dir(self._ctx.shm_completed_dir)
+        self._in_dir(
+            self._ctx.shm_completed_dir,
+            lambda: _get_pdfoutline()(
+                inpdf=self._ctx.combined_pdf_path,
+                tocfile=self._ctx.toc_file_path,
+                outpdf=self._ctx.completed_record_pdf,
+                update_progress=lambda fraction: None,
+            ),
         )
         self.mirror_tree(self._ctx.shm_completed_dir, self._ctx.completed_host)
 
     # ── Scripting helpers ─────────────────────────────────────────────────
+    @_exclusive
     def run_script_in_toc_dir(self, script_path: str) -> None:
         try:
             ext = os.path.splitext(script_path)[1].lower()
@@ -163,53 +350,96 @@ class WorkflowRunner:
             env["DOGEAR_TOC"] = self._ctx.toc_file_path
             env["DOGEAR_TEXTDIR"] = self._ctx.shm_text_dir
 
-            process = subprocess.run(
+            base = os.path.basename(script_path)
+            last_status = 0.0
+
+            def progress(line: str) -> None:
+                # Throttled; the window coalesces whatever gets through.
+                nonlocal last_status
+                now = time.monotonic()
+                if now - last_status >= _SCRIPT_STATUS_INTERVAL:
+                    last_status = now
+                    self._set_status(f"{base}: {line}")
+
+            process = subprocess.Popen(
                 cmd,
                 cwd=self._ctx.shm_toc_dir,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 env=env,
+                text=True,
+                errors="replace",
+                bufsize=1,
             )
-            if process.returncode != 0:
+            self._script_process = process
+            out_tail: deque[str] = deque(maxlen=_SCRIPT_TAIL_LINES)
+            err_tail: deque[str] = deque(maxlen=_SCRIPT_TAIL_LINES)
+            readers = [
+                threading.Thread(target=_drain_pipe, args=(process.stdout, out_tail, progress), daemon=True),
+                threading.Thread(target=_drain_pipe, args=(process.stderr, err_tail), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+            try:
+                returncode = process.wait()
+            finally:
+                self._script_process = None
+            for reader in readers:
+                reader.join()
+
+            if returncode != 0:
+                stderr = "\n".join(err_tail).strip()
                 raise RuntimeError(
-                    f"exit {process.returncode}. stderr:\n{process.stderr or '(none)'}"
+                    f"exit {returncode}. stderr:\n{stderr or '(none)'}"
                 )
 
             self._load_toc()
-            self.mirror_tree(self._ctx.shm_text_dir, self._ctx.host_view_text)
+            self.mirror_tree(self._ctx.shm_text_dir, self._ctx.host_view_text, link=True)
 
-            output = (process.stdout or "").strip()
-            base = os.path.basename(script_path)
+            output = "\n".join(out_tail).strip()
             self._set_status(
                 f"Script '{base}' completed." + (f" Output: {output}" if output else "")
             )
         except Exception as exc:
             self._set_status(f"Script failed: {exc}")
 
+    def terminate_script(self) -> None:
+        """Stop a running post-processing script (e.g. when the window closes)."""
+        process = self._script_process
+        if process is not None and process.poll() is None:
+            try:
+                process.terminate()
+            except Exception:
+                pass
+
     # ── File utilities ─────────────────────────────────────────────────────
-    def mirror_tree(self, src: str, dst: str) -> None:
+    def mirror_tree(self, src: str, dst: str, link: bool = False) -> None:
+        """Mirror src into dst.
+
+        link=True allows hardlinks when both share a filesystem; only pass it
+        for mirrors nobody edits (the text-pages view), never for output the
+        user may modify in place such as completed_host.
+        """
         try:
             if not os.path.isdir(src):
                 os.makedirs(dst, exist_ok=True)
                 return
 
             os.makedirs(dst, exist_ok=True)
-            for name in os.listdir(dst):
-                target = os.path.join(dst, name)
-                try:
-                    shutil.rmtree(target) if os.path.isdir(target) else os.remove(target)
-                except Exception:
-                    pass
-            for name in os.listdir(src):
-                source = os.path.join(src, name)
-                target = os.path.join(dst, name)
-                try:
-                    if os.path.isdir(source):
-                        shutil.copytree(source, target)
-                    else:
-                        shutil.copy2(source, target)
-                except Exception:
-                    pass
+            if link and os.stat(src).st_dev == os.stat(dst).st_dev:
+                # One linkat per file beats copying any bytes at all.
+                _sync_tree(src, dst, link=True)
+                return
+            if _RSYNC:
+                result = subprocess.run(
+                    [_RSYNC, "-a", "--delete", "--inplace", src.rstrip("/") + "/", dst.rstrip("/") + "/"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
+                )
+                if result.returncode == 0:
+                    return
+            _sync_tree(src, dst)
         except Exception as exc:
             self._set_status(f"Mirror failed: {exc}")
 